@@ -1,3 +1,22 @@
 # SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
 #
 # SPDX-License-Identifier: MIT
+
+from type_spy import Function, MetaTypeVars, Signature, SignatureParameters, Type, TypeVar
+
+
+def make_function(
+    name: str,
+    params: list[Type],
+    rt: Type,
+    *,
+    path: str = "",
+    docstring: str | None = None,
+    typevars: list[str] | None = None,
+    vargs: Type | None = None,
+    kwargs: Type | None = None,
+) -> Function:
+    parameters = SignatureParameters([], params, vargs, [], kwargs)
+    typevar_list = MetaTypeVars([TypeVar(name) for name in typevars or []])
+
+    return Function(name, path, docstring, typevar_list, Signature(parameters, rt))
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from type_spy import (
+    Corpus,
+    Function,
+    Ident,
+    MetaTypeVars,
+    QueryCache,
+    Signature,
+    SignatureParameters,
+    TypeVar,
+    TypeVarTuple,
+    Union,
+    canonical_key,
+    type_key,
+)
+
+from . import make_function
+
+
+def test_unequal_queries_never_share_results():
+    # (*0) -> a, once as a TypeVarTuple parameter and once as TypeVar varargs
+    q1 = Function("q1", "", None, MetaTypeVars([TypeVarTuple("0")]), Signature(SignatureParameters([], [TypeVarTuple("0")], None, [], None), Ident("a")))
+    q2 = make_function("q2", [], Ident("a"), vargs=TypeVar("0"), typevars=["0"])
+    # a | b | c, once nested and once flat
+    q3 = make_function("q3", [Union([Ident("a"), Union([Ident("b"), Ident("c")])])], Ident("None"))
+    q4 = make_function("q4", [Union([Ident("a"), Ident("b"), Ident("c")])], Ident("None"))
+
+    for first, second in [(q1, q2), (q3, q4)]:
+        assert first != second
+        assert canonical_key(first) != canonical_key(second)
+
+        corpus = Corpus([second])
+
+        assert corpus.search(first) == []
+        assert corpus.search(second) == [second]
+        assert corpus.cache.info().hits == 0
+
+
+def test_returns_constraint_keys_keep_union_nesting():
+    nested = Union([Ident("a"), Union([Ident("b"), Ident("c")])])
+    flat = Union([Ident("a"), Ident("b"), Ident("c")])
+    corpus = Corpus([make_function("f", [], flat)])
+
+    assert corpus.search(returns=nested) == []
+    assert [func.name for func in corpus.search(returns=flat)] == ["f"]
+
+
+def test_equal_queries_share_results():
+    corpus = Corpus([make_function("identity", [TypeVar("T")], TypeVar("T"), typevars=["T"])])
+
+    first = corpus.search(make_function("q", [TypeVar("A")], TypeVar("A"), typevars=["A"]))
+    second = corpus.search(make_function("q", [TypeVar("B")], TypeVar("B"), typevars=["B"]))
+
+    assert [func.name for func in first] == [func.name for func in second] == ["identity"]
+    assert corpus.cache.info().hits == 1
+
+
+def test_add_invalidates_cached_results():
+    encode = make_function("encode", [Ident("str")], Ident("bytes"), docstring="Encode a string.")
+    other = make_function("encode_utf8", [Ident("str")], Ident("bytes"), docstring="Encode as utf-8.")
+
+    corpus = Corpus([encode])
+
+    assert [func.name for func in corpus.search(text="encode")] == ["encode"]
+    generation = corpus.generation
+
+    corpus.add(other)
+
+    assert corpus.generation == generation + 1
+    assert [func.name for func in corpus.search(text="encode")] == ["encode", "encode_utf8"]
+    assert corpus.cache.info().hits == 0
+
+
+def test_lru_eviction_and_info():
+    cache = QueryCache(maxsize=2)
+
+    assert cache.get("a", 0) is None
+    cache.put("a", 0, [])
+    cache.put("b", 0, [])
+
+    assert cache.get("a", 0) == []  # "a" is now the most recently used
+    cache.put("c", 0, [])
+
+    assert cache.get("b", 0) is None
+    assert cache.get("a", 0) == []
+    assert cache.get("c", 0) == []
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize, info.generation) == (3, 2, 2, 2, 0)
+
+    assert cache.get("a", 1) is None
+    assert cache.info().currsize == 0
+    assert cache.info().generation == 1
+
+
+def test_type_key_rejects_unknown_nodes():
+    with pytest.raises(TypeError):
+        type_key(object())  # type: ignore
+
+
+def test_functions_cannot_bypass_ingest():
+    corpus = Corpus([make_function("f", [Ident("int")], Ident("int"))])
+    generation = corpus.generation
+
+    with pytest.raises(AttributeError):
+        corpus.functions.append(make_function("g", [Ident("str")], Ident("str")))  # type: ignore
+
+    assert len(corpus) == len(corpus.functions) == 1
+    assert corpus.generation == generation
@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from type_spy import (
+    Corpus,
+    Function,
+    Generic,
+    Ident,
+    MetaTypeVars,
+    MinHashLSH,
+    Signature,
+    SignatureParameters,
+    TypeVar,
+    jaccard,
+    shingles,
+    signature_tree,
+    tree_distance,
+)
+
+from . import make_function
+
+
+def list_of(ty):
+    return Generic(Ident("list"), [ty])
+
+
+BASE = make_function(
+    "base",
+    [Ident("int"), Ident("str"), Ident("bytes"), Ident("float"), list_of(Ident("int")), Generic(Ident("dict"), [Ident("str"), Ident("int")])],
+    Ident("bool"),
+)
+NEAR = make_function(
+    "near",
+    [Ident("int"), Ident("str"), Ident("bytes"), Ident("float"), list_of(Ident("int")), Generic(Ident("dict"), [Ident("str"), Ident("float")])],
+    Ident("bool"),
+)
+FAR = make_function("far", [Generic(Ident("Mapping"), [TypeVar("K"), TypeVar("V")])], TypeVar("V"), typevars=["K", "V"])
+
+
+def test_identical_signature_scores_one():
+    corpus = Corpus([FAR, BASE])
+    query = make_function("query", BASE.signature.parameters.params, Ident("bool"))
+
+    func, score = corpus.similar(query)[0]
+
+    assert func is BASE
+    assert score == 1.0
+
+
+def with_parameters(name, pos_only=(), params=(), kwarg_only=()):
+    parameters = SignatureParameters(list(pos_only), list(params), None, list(kwarg_only), None)
+    return Function(name, "", None, MetaTypeVars([]), Signature(parameters, Ident("None")))
+
+
+def dict_of(key, value):
+    return Generic(Ident("dict"), [key, value])
+
+
+COLLISIONS = [
+    (
+        with_parameters("a", params=[list_of(Ident("int")), list_of(Ident("str"))]),
+        with_parameters("b", params=[list_of(Ident("str")), list_of(Ident("int"))]),
+    ),
+    (
+        with_parameters("a", params=[dict_of(Ident("str"), Ident("int"))]),
+        with_parameters("b", params=[dict_of(Ident("int"), Ident("str"))]),
+    ),
+    (
+        with_parameters("a", kwarg_only=[Ident("int")]),
+        with_parameters("b", kwarg_only=[Ident("int"), Ident("int")]),
+    ),
+    (
+        with_parameters("a", pos_only=[Ident("int")]),
+        with_parameters("b", params=[Ident("int")]),
+    ),
+]
+
+
+@pytest.mark.parametrize(("query", "other"), COLLISIONS)
+def test_unequal_signatures_score_below_one(query, other):
+    assert query != other
+    assert shingles(query) != shingles(other)
+    assert tree_distance(signature_tree(query), signature_tree(other)) > 0
+
+    corpus = Corpus([other, query])
+    results = corpus.similar(query)
+
+    assert results[0] == (query, 1.0)
+    assert all(score < 1.0 for func, score in results if func is other)
+
+
+def test_equal_signatures_rank_first():
+    query = make_function("query", [list_of(Ident("int"))], Ident("int"))
+    corpus = Corpus([
+        make_function("close", [list_of(Ident("str"))], Ident("int")),
+        make_function("equal", [list_of(Ident("int"))], Ident("int")),
+    ])
+
+    (first, first_score), (second, second_score) = corpus.similar(query)
+
+    assert (first.name, first_score) == ("equal", 1.0)
+    assert second.name == "close"
+    assert 0.0 < second_score < 1.0
+
+
+def test_near_duplicates_are_candidates():
+    assert jaccard(shingles(BASE), shingles(NEAR)) > 0.7
+    assert jaccard(shingles(BASE), shingles(FAR)) == 0.0
+
+    index = MinHashLSH()
+    index.add(0, shingles(NEAR))
+    index.add(1, shingles(FAR))
+
+    assert index.query(shingles(BASE)) == {0}
+
+    corpus = Corpus([NEAR, FAR])
+    assert [func for func, _ in corpus.similar(BASE)] == [NEAR]
+
+
+def test_vargs_and_kwargs_structure_is_kept():
+    ints = make_function("ints", [], Ident("None"), vargs=list_of(Ident("int")))
+    strs = make_function("strs", [], Ident("None"), vargs=list_of(Ident("str")))
+    kw_ints = make_function("kw_ints", [], Ident("None"), kwargs=list_of(Ident("int")))
+
+    assert shingles(ints) != shingles(strs)
+    assert shingles(ints) != shingles(kw_ints)
+
+    corpus = Corpus([strs])
+    assert all(score < 1.0 for _, score in corpus.similar(ints))
+
+
+def test_nested_callable_fields_are_kept():
+    def takes_callable(vargs):
+        return make_function("f", [make_function("cb", [], Ident("None"), vargs=vargs).signature], Ident("None"))
+
+    assert shingles(takes_callable(Ident("int"))) != shingles(takes_callable(Ident("str")))
+
+
+def test_bands_must_divide_num_perm():
+    with pytest.raises(ValueError):
+        MinHashLSH(num_perm=100, bands=32)
+
+    MinHashLSH(num_perm=96, bands=32)
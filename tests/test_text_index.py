@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from type_spy import Corpus, Generic, Ident, TextIndex, TypeVar, intersect_postings, tokenize
+
+from . import make_function
+
+
+FUNCTIONS = [
+    make_function("compress", [Ident("bytes"), Ident("int")], Ident("bytes"), path="zlib", docstring="Compress data, returning a bytes object."),
+    make_function("decompress", [Ident("bytes")], Ident("bytes"), path="zlib", docstring="Decompress data."),
+    make_function("compress", [Ident("bytes")], Ident("bytes"), path="gzip", docstring="Compress the data with gzip."),
+    make_function("compress_str", [Ident("str")], Ident("str"), path="mylib.text", docstring="Compress a string."),
+    make_function("first", [Generic(Ident("list"), [TypeVar("T")])], TypeVar("T"), path="itertools", typevars=["T"]),
+]
+
+
+def test_tokenize():
+    assert tokenize("mylib.text.compress_str") == ["mylib", "text", "compress", "str"]
+    assert tokenize(None) == []
+
+
+def test_tokenize_unicode():
+    assert tokenize("A naïve Größe") == ["a", "naïve", "größe"]
+    assert tokenize("naïve") == ["naïve"]
+
+
+def test_tokenize_camel_case():
+    assert tokenize("CompressObj") == ["compress", "obj"]
+    assert tokenize("zlib.decompressObj") == ["zlib", "decompress", "obj"]
+    assert tokenize("HTTPServer") == ["httpserver"]
+
+
+def test_text_index_unicode_and_camel_case():
+    index = TextIndex()
+    index.add(0, make_function("CompressObj", [], Ident("None"), path="zlib"))
+    index.add(1, make_function("split", [], Ident("None"), docstring="A naïve splitter."))
+    index.add(2, make_function("na_ve", [], Ident("None")))
+
+    assert index.search("compress") == [0]
+    assert index.search("naïve") == [1]
+
+
+def test_intersect_postings():
+    assert intersect_postings([[1, 3, 5, 7], [3, 4, 5], [0, 3, 5, 9]]) == [3, 5]
+    assert intersect_postings([[1, 2], [3, 4]]) == []
+    assert intersect_postings([[1, 2, 3]]) == [1, 2, 3]
+    assert intersect_postings([]) == []
+
+
+def test_text_index_search():
+    index = TextIndex()
+
+    for doc_id, func in enumerate(FUNCTIONS):
+        index.add(doc_id, func)
+
+    assert index.search("compress") == [0, 2, 3]
+    assert index.search("GZIP compress") == [2]
+    assert index.search("compress unknowntoken") == []
+    assert index.search("") == []
+    assert index.search("...") == []
+
+
+def test_text_index_requires_increasing_ids():
+    index = TextIndex()
+    index.add(1, FUNCTIONS[0])
+
+    with pytest.raises(ValueError):
+        index.add(1, FUNCTIONS[1])
+
+    with pytest.raises(ValueError):
+        index.add(0, FUNCTIONS[1])
+
+
+def test_corpus_search_text_and_returns():
+    corpus = Corpus(FUNCTIONS)
+
+    assert corpus.search(text="compress", returns=Ident("bytes")) == [FUNCTIONS[0], FUNCTIONS[2]]
+    assert [func.path for func in corpus.search(text="compress", returns=Ident("bytes"))] == ["zlib", "gzip"]
+    assert corpus.search(text="compress", returns=Ident("str")) == [FUNCTIONS[3]]
+
+
+def test_corpus_search_returns_typevar():
+    corpus = Corpus(FUNCTIONS)
+
+    assert [func.name for func in corpus.search(returns=TypeVar("T"))] == ["first"]
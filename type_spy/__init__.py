@@ -8,7 +8,11 @@ from typing import cast
 
 import lark
 
+from .cache import *
+from .corpus import *
 from .gen_sigs import *
+from .similarity import *
+from .text_index import *
 from .types import *
 
 l = lark.Lark(
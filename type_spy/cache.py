@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
+#
+# SPDX-License-Identifier: MIT
+
+from collections import OrderedDict
+from typing import Hashable, NamedTuple
+
+from .types import BaseTypeVar, Function, Generic, Ident, List, Signature, SignatureParameters, Type, Union
+
+__all__ = ("type_key", "parameters_key", "canonical_key", "CacheInfo", "QueryCache")
+
+
+def type_key(ty: Type | None) -> Hashable:
+    """Hashable key built from the same fields the ``__eq__`` of each node compares."""
+
+    match ty:
+        case None:
+            return None
+
+        case Ident():
+            return ("Ident", ty.ty)
+
+        case Generic():
+            return ("Generic", type_key(ty.ty), tuple(map(type_key, ty.generics)))
+
+        case List():
+            return ("List", tuple(map(type_key, ty.values)))
+
+        case Union():
+            return ("Union", tuple(map(type_key, ty.tys)))
+
+        case BaseTypeVar():
+            return (ty.__class__.__name__, ty.name)
+
+        case Signature():
+            # Signature.__eq__ only compares the parameters
+            return ("Signature", parameters_key(ty.parameters))
+
+        case _:
+            raise TypeError(f"cannot build a cache key for {ty.__class__.__name__} {ty!r}")
+
+
+def parameters_key(parameters: SignatureParameters) -> Hashable:
+    return (
+        tuple(map(type_key, parameters.pos_only)),
+        tuple(map(type_key, parameters.params)),
+        type_key(parameters.vargs),
+        tuple(map(type_key, parameters.kwarg_only)),
+        type_key(parameters.kwargs),
+    )
+
+
+def canonical_key(func: Function) -> Hashable:
+    """Key of a query built from its normalized parameters and return type.
+
+    The name, path, docstring and the names of the query's type variables
+    don't take part in it.
+    """
+
+    return ("Function", parameters_key(func._parameters), type_key(func._return))
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    generation: int
+
+
+class QueryCache:
+    """Bounded LRU cache of query results.
+
+    Every lookup passes the current generation of the corpus, when it differs
+    from the generation the entries were stored under the whole cache is dropped.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, list[Function]] = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _check_generation(self, generation: int):
+        if generation != self.generation:
+            self.entries.clear()
+            self.generation = generation
+
+    def get(self, key: Hashable, generation: int) -> list[Function] | None:
+        self._check_generation(generation)
+
+        try:
+            result = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+
+        return result
+
+    def put(self, key: Hashable, generation: int, result: list[Function]):
+        if self.maxsize <= 0:
+            return
+
+        self._check_generation(generation)
+
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries), self.generation)
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
+#
+# SPDX-License-Identifier: MIT
+
+from typing import Iterable
+
+from .cache import QueryCache, canonical_key, type_key
+from .gen_sigs import find_matching
+from .similarity import MinHashLSH, Tree, shingles, signature_tree, tree_similarity
+from .text_index import TextIndex, tokenize
+from .types import Function, Type, normalize_type
+
+__all__ = ("Corpus",)
+
+
+class Corpus:
+    """A searchable collection of functions.
+
+    Text queries are resolved against the inverted index first, only the
+    functions left after the posting lists are merged get their types compared.
+    Similarity queries pull approximate candidates out of the MinHash index and
+    re-rank only those by tree distance between the normalized signatures.
+
+    ``generation`` is bumped every time a function is added, search results
+    are cached per generation so ingesting anything invalidates them. Functions
+    must be ingested through ``add`` or ``extend``, ``functions`` is a snapshot.
+    """
+
+    def __init__(self, functions: Iterable[Function] = (), cache_size: int = 256) -> None:
+        self._functions: list[Function] = []
+        self.generation = 0
+        self.cache = QueryCache(cache_size)
+        self.text_index = TextIndex()
+        self._trees: list[Tree] = []
+        self._returns: list[Type] = []
+        self.similarity_index = MinHashLSH()
+
+        self.extend(functions)
+
+    @property
+    def functions(self) -> tuple[Function, ...]:
+        return tuple(self._functions)
+
+    def __len__(self) -> int:
+        return len(self._functions)
+
+    def add(self, func: Function):
+        doc_id = len(self._functions)
+
+        self._functions.append(func)
+        self.generation += 1
+        self.text_index.add(doc_id, func)
+        self._returns.append(normalize_type(func._return))
+
+        self._trees.append(signature_tree(func))
+        self.similarity_index.add(doc_id, shingles(func))
+
+    def extend(self, functions: Iterable[Function]):
+        for func in functions:
+            self.add(func)
+
+    def search(self, query: Function | None = None, text: str | None = None, returns: Type | None = None) -> list[Function]:
+        """Functions matching every given constraint.
+
+        ``returns`` is compared up to renaming of type variables, so
+        ``TypeVar("T")`` matches any function returning a bare type variable.
+        """
+
+        key = (
+            canonical_key(query) if query is not None else None,
+            " ".join(sorted(set(tokenize(text)))) if text is not None else None,
+            type_key(normalize_type(returns)) if returns is not None else None,
+        )
+
+        if (result := self.cache.get(key, self.generation)) is None:
+            result = self._search(query, text, returns)
+            self.cache.put(key, self.generation, result)
+
+        return list(result)
+
+    def _search(self, query: Function | None, text: str | None, returns: Type | None) -> list[Function]:
+        if text is not None:
+            doc_ids = self.text_index.search(text)
+        else:
+            doc_ids = range(len(self._functions))
+
+        if returns is not None:
+            returns = normalize_type(returns)
+            doc_ids = [doc_id for doc_id in doc_ids if self._returns[doc_id] == returns]
+
+        candidates = [self._functions[doc_id] for doc_id in doc_ids]
+
+        if query is not None:
+            candidates = list(find_matching(iter(candidates), query))
+
+        return list(candidates)
+
+    def similar(self, query: Function, limit: int = 10) -> list[tuple[Function, float]]:
+        """Functions with a signature close to ``query``, best first.
+
+        Scores come from the tree distance between normalized signatures, only
+        functions which compare equal to ``query`` score 1.0.
+        """
+
+        query_tree = signature_tree(query)
+        scored: list[tuple[float, int]] = []
+
+        for doc_id in self.similarity_index.query(shingles(query)):
+            if self._functions[doc_id] == query:
+                score = 1.0
+            else:
+                score = min(tree_similarity(query_tree, self._trees[doc_id]), 1.0 - 1e-9)
+
+            scored.append((score, doc_id))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        return [(self._functions[doc_id], score) for score, doc_id in scored[:limit]]
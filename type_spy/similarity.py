@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import random
+from typing import Iterator
+
+from .types import BaseTypeVar, Function, Generic, Ident, List, Signature, SignatureParameters, Type, Union
+
+__all__ = ("shingles", "jaccard", "signature_tree", "tree_size", "tree_distance", "tree_similarity", "MinHashLSH")
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _head(ty: Type | None) -> str:
+    match ty:
+        case Ident():
+            return ty.ty
+
+        case Generic():
+            return f"{_head(ty.ty)}[]"
+
+        case List():
+            return "[]"
+
+        case Union():
+            return "|"
+
+        case BaseTypeVar():
+            return f"{ty.__class__.__name__}:{ty.name}"
+
+        case Signature():
+            return "->"
+
+        case _:
+            return "?"
+
+
+def _children(ty: Type | None) -> list[tuple[str, Type]]:
+    match ty:
+        case Generic():
+            return [(f"{i}:", arg) for i, arg in enumerate(ty.generics)]
+
+        case List():
+            return [(f"{i}:", arg) for i, arg in enumerate(ty.values)]
+
+        case Union():
+            return [(f"{i}:", arg) for i, arg in enumerate(ty.tys)]
+
+        case Signature():
+            parameters = ty.parameters
+            children = [(f"pos{i}:", arg) for i, arg in enumerate(parameters.pos_only)]
+            children.extend((f"{i}:", arg) for i, arg in enumerate(parameters.params))
+            children.extend((f"kw{i}:", arg) for i, arg in enumerate(parameters.kwarg_only))
+
+            if parameters.vargs is not None:
+                children.append(("*", parameters.vargs))
+
+            if parameters.kwargs is not None:
+                children.append(("**", parameters.kwargs))
+
+            children.append(("rt:", ty.rt))
+
+            return children
+
+        case _:
+            return []
+
+
+def _paths(ty: Type | None, prefix: str) -> Iterator[str]:
+    path = f"{prefix}/{_head(ty)}"
+    yield path
+
+    for label, child in _children(ty):
+        yield from _paths(child, f"{path}/{label}")
+
+
+def shingles(func: Function) -> set[str]:
+    """Structural features of the normalized signature of ``func``."""
+
+    parameters = func._parameters
+    result = {f"rt:{_head(func._return)}"}
+    result.update(_paths(func._return, "rt"))
+
+    result.add(f"arity:{len(parameters.pos_only)}/{len(parameters.params)}/{len(parameters.kwarg_only)}")
+
+    for i, ty in enumerate(parameters.pos_only):
+        result.add(f"pos{i}:{_head(ty)}")
+        result.update(_paths(ty, f"pos{i}"))
+
+    for i, ty in enumerate(parameters.params):
+        result.add(f"param{i}:{_head(ty)}")
+        result.update(_paths(ty, f"param{i}"))
+
+    for i, ty in enumerate(parameters.kwarg_only):
+        result.add(f"kwarg{i}:{_head(ty)}")
+        result.update(_paths(ty, f"kwarg{i}"))
+
+    if parameters.vargs is not None:
+        result.add(f"vargs:{_head(parameters.vargs)}")
+        result.update(_paths(parameters.vargs, "vargs"))
+
+    if parameters.kwargs is not None:
+        result.add(f"kwargs:{_head(parameters.kwargs)}")
+        result.update(_paths(parameters.kwargs, "kwargs"))
+
+    return result
+
+
+Tree = tuple[tuple[str, ...], tuple["Tree", ...]]
+
+
+def _type_tree(ty: Type | None) -> Tree:
+    match ty:
+        case Ident():
+            return (("Ident", ty.ty), ())
+
+        case Generic():
+            return (("Generic",), (_type_tree(ty.ty), *map(_type_tree, ty.generics)))
+
+        case List():
+            return (("List",), tuple(map(_type_tree, ty.values)))
+
+        case Union():
+            return (("Union",), tuple(map(_type_tree, ty.tys)))
+
+        case BaseTypeVar():
+            return ((ty.__class__.__name__, ty.name), ())
+
+        case Signature():
+            return _signature_tree(ty.parameters, ty.rt)
+
+        case _:
+            return (("?",), ())
+
+
+def _signature_tree(parameters: SignatureParameters, rt: Type) -> Tree:
+    def group(name: str, tys: list[Type | None]) -> Tree:
+        return ((name,), tuple(_type_tree(ty) for ty in tys if ty is not None))
+
+    return (
+        ("Signature",),
+        (
+            group("pos_only", parameters.pos_only),
+            group("params", parameters.params),
+            group("vargs", [parameters.vargs]),
+            group("kwarg_only", parameters.kwarg_only),
+            group("kwargs", [parameters.kwargs]),
+            group("rt", [rt]),
+        ),
+    )
+
+
+def signature_tree(func: Function) -> Tree:
+    """The normalized signature of ``func`` as a labelled ordered tree."""
+
+    return _signature_tree(func._parameters, func._return)
+
+
+def tree_size(tree: Tree) -> int:
+    return 1 + sum(map(tree_size, tree[1]))
+
+
+def tree_distance(a: Tree, b: Tree) -> int:
+    """Top-down ordered edit distance, children are aligned by position.
+
+    A relabel costs 1, a child missing from one side costs its whole size.
+    The distance is 0 only for identical trees.
+    """
+
+    if a == b:
+        return 0
+
+    distance = int(a[0] != b[0])
+
+    for child_a, child_b in zip(a[1], b[1]):
+        distance += tree_distance(child_a, child_b)
+
+    for extra in a[1][len(b[1]):] + b[1][len(a[1]):]:
+        distance += tree_size(extra)
+
+    return distance
+
+
+def tree_similarity(a: Tree, b: Tree) -> float:
+    return 1 - tree_distance(a, b) / (tree_size(a) + tree_size(b))
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    if not a and not b:
+        return 1.0
+
+    return len(a & b) / len(a | b)
+
+
+def _hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+
+
+class MinHashLSH:
+    """Locality sensitive index over MinHash signatures of shingle sets.
+
+    Signatures are split into ``bands`` bands of ``num_perm // bands`` rows,
+    two sets become candidates of each other if any band hashes identically.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, seed: int = 1) -> None:
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self.permutations = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+        self.buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(bands)]
+
+    def minhash(self, items: set[str]) -> list[int]:
+        hashes = [_hash(item) for item in items]
+
+        if not hashes:
+            return [_MAX_HASH] * self.num_perm
+
+        return [min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes) for a, b in self.permutations]
+
+    def _bands(self, signature: list[int]) -> Iterator[tuple[int, tuple[int, ...]]]:
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, tuple(signature[start:start + self.rows])
+
+    def add(self, doc_id: int, items: set[str]):
+        for band, key in self._bands(self.minhash(items)):
+            self.buckets[band].setdefault(key, []).append(doc_id)
+
+    def query(self, items: set[str]) -> set[int]:
+        candidates: set[int] = set()
+
+        for band, key in self._bands(self.minhash(items)):
+            candidates.update(self.buckets[band].get(key, ()))
+
+        return candidates
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2023-present Zomatree <me@zomatree.live>
+#
+# SPDX-License-Identifier: MIT
+
+import re
+
+from .types import Function
+
+__all__ = ("tokenize", "intersect_postings", "TextIndex")
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _split_camel_case(text: str) -> str:
+    return "".join(f" {char}" if prev.islower() and char.isupper() else char for prev, char in zip(" " + text, text))
+
+
+def tokenize(text: str | None) -> list[str]:
+    if not text:
+        return []
+
+    return _TOKEN_RE.findall(_split_camel_case(text).lower())
+
+
+def intersect_postings(postings: list[list[int]]) -> list[int]:
+    if not postings:
+        return []
+
+    # merge the shortest lists first so the running result shrinks as fast as possible
+    postings = sorted(postings, key=len)
+    result = postings[0]
+
+    for other in postings[1:]:
+        if not result:
+            break
+
+        merged: list[int] = []
+        i = j = 0
+
+        while i < len(result) and j < len(other):
+            if result[i] == other[j]:
+                merged.append(result[i])
+                i += 1
+                j += 1
+            elif result[i] < other[j]:
+                i += 1
+            else:
+                j += 1
+
+        result = merged
+
+    return result
+
+
+class TextIndex:
+    """Inverted index over the name, dotted path and docstring of functions.
+
+    Documents are identified by integer ids which must be added in increasing
+    order, this keeps every posting list sorted without having to re-sort.
+    """
+
+    def __init__(self) -> None:
+        self.postings: dict[str, list[int]] = {}
+        self.last_id = -1
+
+    def add(self, doc_id: int, func: Function):
+        if doc_id <= self.last_id:
+            raise ValueError(f"document ids must be increasing, got {doc_id} after {self.last_id}")
+
+        self.last_id = doc_id
+
+        tokens = set(tokenize(func.name))
+        tokens.update(tokenize(func.path))
+        tokens.update(tokenize(func.docstring))
+
+        for token in tokens:
+            self.postings.setdefault(token, []).append(doc_id)
+
+    def search(self, text: str) -> list[int]:
+        tokens = set(tokenize(text))
+
+        if not tokens:
+            return []
+
+        postings: list[list[int]] = []
+
+        for token in tokens:
+            if not (posting := self.postings.get(token)):
+                return []
+
+            postings.append(posting)
+
+        return intersect_postings(postings)
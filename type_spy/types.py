@@ -211,3 +211,40 @@ def remap_types(typevar_map: dict[BaseTypeVar, BaseTypeVar], type: Type):
                     return v
 
             return type
+
+
+def collect_typevars(type: Type | None, found: list[BaseTypeVar]) -> list[BaseTypeVar]:
+    match type:
+        case Generic():
+            collect_typevars(type.ty, found)
+
+            for arg in type.generics:
+                collect_typevars(arg, found)
+
+        case BaseTypeVar():
+            if type not in found:
+                found.append(type)
+
+        case List():
+            for arg in type.values:
+                collect_typevars(arg, found)
+
+        case Union():
+            for arg in type.tys:
+                collect_typevars(arg, found)
+
+        case Signature():
+            parameters = type.parameters
+
+            for arg in [*parameters.pos_only, *parameters.params, parameters.vargs, *parameters.kwarg_only, parameters.kwargs, type.rt]:
+                collect_typevars(arg, found)
+
+    return found
+
+
+def normalize_type(type: Type) -> Type:
+    """Renames the type variables of ``type`` to ``0``, ``1``, ... in order of first appearance."""
+
+    typevar_map = {old: old.__class__(str(i)) for i, old in enumerate(collect_typevars(type, []))}
+
+    return remap_types(typevar_map, type)